@@ -3,12 +3,14 @@
 import os
 from unittest import TestCase, mock
 
+import pytest
 import tidy3d.web as web
 from tidy3d.web.auth import encode_password, get_credentials
 
 from ..utils import SIM_FULL as sim_original
 
 CALLBACK_URL = "https://callbackurl"
+FIRST_MONITOR_NAME = sim_original.monitors[0].name
 
 """ core webapi """
 
@@ -80,8 +82,7 @@ def test_webapi_6_load(tmp_path):
     """load the results into sim_data"""
     task_id = _get_gloabl_task_id()
     sim_data = web.load(task_id, path=str(tmp_path / "sim_data.hdf5"))
-    first_monitor_name = sim_original.monitors[0].name
-    _ = sim_data[first_monitor_name]
+    _ = sim_data[FIRST_MONITOR_NAME]
 
 
 def test_webapi_7_download_json():
@@ -169,8 +170,7 @@ def test_job_6_load(tmp_path):
     """load the results into sim_data"""
     job = _get_gloabl_job()
     sim_data = job.load(path=str(tmp_path / "sim_data.hdf5"))
-    first_monitor_name = sim_original.monitors[0].name
-    _ = sim_data[first_monitor_name]
+    _ = sim_data[FIRST_MONITOR_NAME]
 
 
 def _test_job_7_delete():
@@ -191,19 +191,21 @@ def _get_gloabl_batch():
     return batches_global[0]
 
 
-def test_batch_0_run(tmp_path):
+@pytest.fixture(scope="module")
+def batch_simulations():
+    """simulations submitted in the batch tests"""
+    return {f"task_{i}": sim_original for i in range(2)}
+
+
+def test_batch_0_run(tmp_path, batch_simulations):
     """test complete run"""
-    sims = 2 * [sim_original]
-    simulations = {f"task_{i}": sims[i] for i in range(len(sims))}
-    batch = web.Batch(simulations=simulations)
+    batch = web.Batch(simulations=batch_simulations)
     batch.run(path_dir=str(tmp_path))
 
 
-def test_batch_1_upload():
+def test_batch_1_upload(batch_simulations):
     """test that task uploads ok"""
-    sims = 2 * [sim_original]
-    simulations = {f"task_{i}": sims[i] for i in range(len(sims))}
-    batch = web.Batch(simulations=simulations)
+    batch = web.Batch(simulations=batch_simulations)
     batches_global.append(batch)
 
 
@@ -235,9 +237,8 @@ def test_batch_6_load(tmp_path):
     """load the results into sim_data"""
     batch = _get_gloabl_batch()
     sim_data_dict = batch.load(path_dir=str(tmp_path))
-    first_monitor_name = sim_original.monitors[0].name
     for _, sim_data in sim_data_dict.items():
-        _ = sim_data[first_monitor_name]
+        _ = sim_data[FIRST_MONITOR_NAME]
 
 
 def test_batchdata_7_load(tmp_path):
@@ -261,6 +262,5 @@ def test_web_run_async():
     """test complete run"""
     sims = 2 * [sim_original]
     batch_data = web.run_async(sims)
-    first_monitor_name = sim_original.monitors[0].name
     for _, sim_data in batch_data.items():
-        _ = sim_data[first_monitor_name]
+        _ = sim_data[FIRST_MONITOR_NAME]
@@ -3,8 +3,12 @@
 import numpy as np
 import pytest
 import tidy3d as td
-from tidy3d.components.field_projection import FieldProjector
-from tidy3d.exceptions import DataError
+from tidy3d.components.field_projection import (
+    FieldProjector,
+    _propagation_phase,
+    _radiation_integrals,
+)
+from tidy3d.exceptions import DataError, SetupError
 
 MEDIUM = td.Medium(permittivity=3)
 WAVELENGTH = 1
@@ -376,6 +380,18 @@ def test_proj_clientside():
     with pytest.raises(DataError):
         exact_fields_cartesian.renormalize_fields(proj_distance=5e6)
 
+    # frequencies missing from the near field data cannot be projected
+    ((surfaces, currents),) = proj._surface_groups(proj.currents)
+    with pytest.raises(SetupError):
+        proj._far_fields_for_surfaces(
+            frequency=2 * f0,
+            theta=0,
+            phi=0,
+            surfaces=surfaces,
+            currents=currents,
+            medium=proj.medium,
+        )
+
 
 def make_2d_proj_monitors(center, size, freqs, plane):
     """Helper function to make near-to-far monitors in 2D simulations."""
@@ -617,3 +633,138 @@ def test_2d_proj_clientside():
 def test_trapezoid(array, pts, axes, expected):
     result = FieldProjector.trapezoid(array, pts, axes)
     assert np.allclose(result, expected)
+
+
+@pytest.mark.parametrize(
+    "array, pts",
+    [
+        (np.array([1.0, 2.0, 3.0]), np.array([0.0, 1.0, 2.0])),
+        (np.array([1.0, 2.0, 3.0, 5.0]), np.array([0.0, 0.5, 2.0, 2.25])),
+        (np.array([2.0]), np.array([0.0])),
+    ],
+)
+def test_trapezoid_weights(array, pts):
+    weights = FieldProjector.trapezoid_weights(pts)
+    assert np.allclose(np.dot(weights, array), FieldProjector.trapezoid(array, pts))
+
+
+@pytest.mark.parametrize("wavenumber", [2.0 + 0j, 2.0 + 0.1j])
+def test_propagation_phase(wavenumber):
+    dist = np.linspace(-3, 3, 24).reshape(2, 3, 4)
+    assert np.allclose(_propagation_phase(wavenumber, dist), np.exp(-1j * wavenumber * dist))
+
+
+@pytest.mark.parametrize("max_bytes", [2**28, 1])
+def test_radiation_integrals(monkeypatch, max_bytes):
+    monkeypatch.setattr("tidy3d.components.field_projection.MAX_INTEGRAL_BYTES", max_bytes)
+    rng = np.random.default_rng(0)
+    phase_x = rng.random((4, 3, 5)) + 1j * rng.random((4, 3, 5))
+    phase_y = rng.random((6, 3, 5)) + 1j * rng.random((6, 3, 5))
+    phase_z = rng.random((2, 3)) + 1j * rng.random((2, 3))
+    sources = rng.random((4, 4, 6, 2)) + 1j * rng.random((4, 4, 6, 2))
+    expected = np.einsum("xtp,ytp,zt,cxyz->ctp", phase_x, phase_y, phase_z, sources)
+    assert np.allclose(_radiation_integrals(phase_x, phase_y, phase_z, sources), expected)
+
+
+def make_planar_sim_data(monitors, f0):
+    """Helper function to make simulation data with random fields on planar z-normal monitors."""
+    rng = np.random.default_rng(0)
+    sim = td.Simulation(
+        size=(5, 5, 5),
+        grid_spec=td.GridSpec.auto(wavelength=td.C_0 / f0),
+        monitors=monitors,
+        run_time=1e-12,
+    )
+
+    data = []
+    for monitor in monitors:
+        coords = dict(
+            x=np.linspace(-1, 1, 10), y=np.linspace(-1, 1, 10), z=[monitor.center[2]], f=[f0]
+        )
+        fields = {
+            name: td.ScalarFieldDataArray((1 + 1j) * rng.random((10, 10, 1, 1)), coords=coords)
+            for name in ("Ex", "Ey", "Ez", "Hx", "Hy", "Hz")
+        }
+        data.append(
+            td.FieldData(
+                monitor=monitor,
+                symmetry=sim.symmetry,
+                symmetry_center=sim.center,
+                grid_expanded=sim.discretize_monitor(monitor),
+                **fields,
+            )
+        )
+    return td.SimulationData(simulation=sim, data=data)
+
+
+def test_proj_surface_groups(monkeypatch):
+    """Opposite surfaces with matching samples are projected together, with the same result as
+    projecting each surface separately."""
+
+    f0 = 1e13
+    monitors = [
+        td.FieldMonitor(size=(2, 2, 0), center=(0, 0, z), freqs=[f0], name=f"near_{i}")
+        for i, z in enumerate([-0.5, 0.5])
+    ]
+    sim_data = make_planar_sim_data(monitors, f0)
+
+    proj = td.FieldProjector.from_near_field_monitors(
+        sim_data=sim_data, near_monitors=monitors, normal_dirs=["-", "+"]
+    )
+    assert len(proj._surface_groups(proj.currents)) == 1
+
+    proj_monitors = make_proj_monitors((0, 0, 0), (2, 2, 1), [f0])[:3]
+    grouped = [proj.project_fields(monitor) for monitor in proj_monitors]
+
+    monkeypatch.setattr(
+        FieldProjector,
+        "_surface_groups",
+        lambda self, currents: [
+            ([surface], [currents[surface.monitor.name]]) for surface in self.surfaces
+        ],
+    )
+    for monitor, fields in zip(proj_monitors, grouped):
+        separate = proj.project_fields(monitor)
+        for name, field in fields.field_components.items():
+            assert np.allclose(field.values, separate.field_components[name].values)
+
+
+def test_proj_precision():
+    """Single precision far field projections agree with double precision ones."""
+
+    f0 = 1e13
+    monitor = td.FieldMonitor(size=(2, 2, 0), center=(0, 0, 0), freqs=[f0], name="near_field")
+    sim_data = make_planar_sim_data([monitor], f0)
+
+    proj_double = td.FieldProjector.from_near_field_monitors(
+        sim_data=sim_data, near_monitors=[monitor], normal_dirs=["+"]
+    )
+    proj_single = td.FieldProjector.from_near_field_monitors(
+        sim_data=sim_data, near_monitors=[monitor], normal_dirs=["+"], precision="single"
+    )
+
+    for proj_monitor in make_proj_monitors((0, 0, 0), (2, 2, 0), [f0])[:3]:
+        fields_double = proj_double.project_fields(proj_monitor)
+        fields_single = proj_single.project_fields(proj_monitor)
+        for name, field in fields_double.field_components.items():
+            values = field.values
+            assert np.allclose(
+                values, fields_single.field_components[name].values, atol=1e-5 * abs(values).max()
+            )
+
+
+def test_proj_normal_dir():
+    """Flipping the normal direction of a surface flips the sign of its currents."""
+
+    f0 = 1e13
+    monitor = td.FieldMonitor(size=(2, 2, 0), center=(0, 0, 0), freqs=[f0], name="near_field")
+    field_data = make_planar_sim_data([monitor], f0)[monitor.name]
+
+    currents = {
+        normal_dir: FieldProjector._fields_to_currents(
+            field_data, td.FieldProjectionSurface(monitor=monitor, normal_dir=normal_dir)
+        )
+        for normal_dir in "+-"
+    }
+    for name, current in currents["+"].field_components.items():
+        assert np.allclose(current.values, -currents["-"].field_components[name].values)
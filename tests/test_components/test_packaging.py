@@ -62,5 +62,14 @@ def test_check_import():
     assert mock_check_import("module2") is False
 
 
+def test_import_without_pyplot():
+    """Importing tidy3d should not load ``matplotlib.pyplot``, which is only needed for plotting."""
+    import subprocess
+    import sys
+
+    code = "import sys, tidy3d, tidy3d.web; assert 'matplotlib.pyplot' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -3,7 +3,7 @@
 import matplotlib.pyplot as plt
 import pytest
 import tidy3d as td
-from tidy3d.components.viz import Polygon
+from tidy3d.components.viz import Polygon, add_ax_if_none, equal_aspect
 from tidy3d.constants import inf
 
 
@@ -12,6 +12,30 @@ def test_make_polygon_dict():
     p.interiors
 
 
+def test_plot_decorators():
+    """Axes are only created when none are supplied, and the wrapped function is preserved."""
+
+    @equal_aspect
+    @add_ax_if_none
+    def plot(ax=None):
+        """Plot nothing."""
+        return ax
+
+    assert plot.__name__ == "plot"
+    assert plot.__doc__ == "Plot nothing."
+
+    num_figs = len(plt.get_fignums())
+    _, ax = plt.subplots()
+    assert plot(ax=ax) is ax
+    assert len(plt.get_fignums()) == num_figs + 1
+
+    new_ax = plot()
+    assert new_ax is not ax
+    assert new_ax.get_aspect() == 1.0
+    assert len(plt.get_fignums()) == num_figs + 2
+    plt.close("all")
+
+
 @pytest.mark.parametrize("center_z, len_collections", ((0, 1), (0.1, 0)))
 def test_0d_plot(center_z, len_collections):
     """Ensure that 0d objects show up in plots."""
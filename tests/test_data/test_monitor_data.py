@@ -352,6 +352,18 @@ def test_colocate():
     # ignore coordinate
     _ = data.colocate(x=[+0.1, 0.5], y=None, z=[+0.1, 0.5])
 
+    # data with decreasing coordinates is colocated as its sorted counterpart
+    flipped = data.updated_copy(
+        **{
+            name: field.isel(x=slice(None, None, -1))
+            for name, field in data.field_components.items()
+        }
+    )
+    colocated = data.colocate(x=[+0.1, 0.5], y=[+0.1, 0.5], z=[+0.1, 0.5])
+    colocated_flipped = flipped.colocate(x=[+0.1, 0.5], y=[+0.1, 0.5], z=[+0.1, 0.5])
+    for name in data.field_components:
+        assert np.allclose(colocated[name].values, colocated_flipped[name].values)
+
     # data outside range of len(coord)==1 dimension
     data = make_mode_solver_data()
     with pytest.raises(DataError):
@@ -1,5 +1,8 @@
 # Tests webapi and things that depend on it
 
+import json
+import time
+
 import numpy as np
 import pytest
 import responses
@@ -309,6 +312,23 @@ def test_upload(mock_upload):
     assert upload(sim, TASK_NAME, PROJECT_NAME)
 
 
+@responses.activate
+def test_upload_serializes_once(mock_upload, monkeypatch):
+    """Repeated uploads of a simulation reuse its cached json serialization."""
+    sim = make_sim()
+    serialized = []
+    to_json = td.Simulation._json
+
+    def count_json(self, *args, **kwargs):
+        serialized.append(self)
+        return to_json(self, *args, **kwargs)
+
+    monkeypatch.setattr(td.Simulation, "_json", count_json)
+    for _ in range(3):
+        assert upload(sim, TASK_NAME, PROJECT_NAME)
+    assert serialized == [sim]
+
+
 @responses.activate
 def test_get_info(mock_get_info):
     assert get_info(TASK_ID).taskId == TASK_ID
@@ -565,6 +585,55 @@ def test_batch(mock_webapi, mock_job_status, mock_load, tmp_path):
     assert b2.real_cost() == FLEX_UNIT * len(sims)
 
 
+@responses.activate
+def test_batch_upload_gets_folder_once(set_api_key, monkeypatch):
+    monkeypatch.setattr(f"{task_core_path}.FOLDER_CACHE", {})
+    monkeypatch.setattr(f"{task_core_path}.upload_file", lambda *args, **kwargs: None)
+
+    def get_folder(request):
+        # slow enough that concurrent uploads would all miss the folder cache
+        time.sleep(0.1)
+        return 200, {}, json.dumps({"data": {"projectId": FOLDER_ID, "projectName": PROJECT_NAME}})
+
+    responses.add_callback(
+        responses.GET, f"{Env.current.web_api_endpoint}/tidy3d/project", callback=get_folder
+    )
+    responses.add(
+        responses.POST,
+        f"{Env.current.web_api_endpoint}/tidy3d/projects/{FOLDER_ID}/tasks",
+        json={"data": {"taskId": TASK_ID, "taskName": TASK_NAME, "createdAt": CREATED_AT}},
+        status=200,
+    )
+
+    sims = {f"{TASK_NAME}_{i}": make_sim() for i in range(3)}
+    Batch(simulations=sims, folder_name=PROJECT_NAME, verbose=False).upload()
+
+    urls = [call.request.url for call in responses.calls]
+    assert sum("tidy3d/project?" in url for url in urls) == 1
+    assert sum(url.endswith(f"projects/{FOLDER_ID}/tasks") for url in urls) == len(sims)
+
+
+@responses.activate
+def test_batch_upload_cached_task_ids(set_api_key, monkeypatch):
+    """A batch whose jobs already have task IDs, e.g. loaded from file, sends no requests."""
+    monkeypatch.setattr(f"{task_core_path}.FOLDER_CACHE", {})
+
+    sims = {f"{TASK_NAME}_{i}": make_sim() for i in range(3)}
+    jobs = {
+        task_name: Job(
+            simulation=sim,
+            task_name=task_name,
+            folder_name=PROJECT_NAME,
+            task_id_cached=f"{TASK_ID}_{task_name}",
+            verbose=False,
+        )
+        for task_name, sim in sims.items()
+    }
+    Batch(simulations=sims, folder_name=PROJECT_NAME, jobs_cached=jobs, verbose=False).upload()
+
+    assert len(responses.calls) == 0
+
+
 """ Async """
 
 
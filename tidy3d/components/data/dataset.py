@@ -9,7 +9,6 @@ from typing import Any, Callable, Dict, Tuple, Union
 import numpy as np
 import pydantic.v1 as pd
 import xarray as xr
-from matplotlib import pyplot as plt
 from matplotlib.tri import Triangulation
 
 from ...constants import PICOSECOND_PER_NANOMETER_PER_KILOMETER, inf
@@ -137,8 +136,14 @@ class AbstractFieldDataset(Dataset, ABC):
                         f"supply {coord_name}=None to skip it."
                     )
 
+            # data on the simulation grid is already sorted, which lets the interpolation
+            # skip sorting a copy of it
+            assume_sorted = all(
+                np.all(np.diff(field_data.coords[coord_name].values) > 0)
+                for coord_name in supplied_coord_map
+            )
             centered_fields[field_name] = field_data.interp(
-                **supplied_coord_map, kwargs={"bounds_error": True}
+                **supplied_coord_map, assume_sorted=assume_sorted, kwargs={"bounds_error": True}
             )
 
         # combine all centered fields in a dataset
@@ -2261,6 +2266,8 @@ class TriangularGridDataset(UnstructuredGridDataset):
             )
 
             if cbar:
+                import matplotlib.pyplot as plt
+
                 label_kwargs = {}
                 if "label" not in cbar_kwargs:
                     label_kwargs["label"] = self.values.name
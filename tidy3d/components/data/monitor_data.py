@@ -2098,13 +2098,16 @@ class AbstractFieldProjectionData(MonitorData):
             )
             r, theta, phi = self.monitor.car_2_sph(xs, ys, zs)
         else:
-            uxs, uys, r = np.meshgrid(
-                self.coords["ux"].values,
-                self.coords["uy"].values,
-                self.coords["r"].values,
-                indexing="ij",
+            # the angles do not depend on r, so only evaluate them on the (ux, uy) plane
+            theta, phi = self.monitor.kspace_2_sph(
+                self.coords["ux"].values[:, None, None],
+                self.coords["uy"].values[None, :, None],
+                self.monitor.proj_axis,
+            )
+            r, theta, phi = (
+                np.array(coord)
+                for coord in np.broadcast_arrays(self.coords["r"].values[None, None, :], theta, phi)
             )
-            theta, phi = self.monitor.kspace_2_sph(uxs, uys, self.monitor.proj_axis)
         return {"r": r, "theta": theta, "phi": phi}
 
     @property
@@ -2207,19 +2210,15 @@ class AbstractFieldProjectionData(MonitorData):
         """
         # convert the field components to the Cartesian coordinate system
         coords_sph = self.coords_spherical
-        e_data = self.monitor.sph_2_car_field(
-            self.Er.values,
-            self.Etheta.values,
-            self.Ephi.values,
-            coords_sph["theta"][..., None],
-            coords_sph["phi"][..., None],
+        theta = coords_sph["theta"][..., None]
+        phi = coords_sph["phi"][..., None]
+        # the same angle terms are shared by the E and H conversions
+        trig = (np.sin(theta), np.cos(theta), np.sin(phi), np.cos(phi))
+        e_data = self.monitor.sph_2_car_field_trig(
+            self.Er.values, self.Etheta.values, self.Ephi.values, *trig
         )
-        h_data = self.monitor.sph_2_car_field(
-            self.Hr.values,
-            self.Htheta.values,
-            self.Hphi.values,
-            coords_sph["theta"][..., None],
-            coords_sph["phi"][..., None],
+        h_data = self.monitor.sph_2_car_field_trig(
+            self.Hr.values, self.Htheta.values, self.Hphi.values, *trig
         )
 
         # package into dataset
@@ -2896,11 +2895,12 @@ class DiffractionData(AbstractFieldProjectionData):
         theta = theta.values
         phi = phi.values
 
-        e_x, e_y, e_z = self.monitor.sph_2_car_field(
-            0, self.Etheta.values, self.Ephi.values, theta, phi
+        trig = (np.sin(theta), np.cos(theta), np.sin(phi), np.cos(phi))
+        e_x, e_y, e_z = self.monitor.sph_2_car_field_trig(
+            0, self.Etheta.values, self.Ephi.values, *trig
         )
-        h_x, h_y, h_z = self.monitor.sph_2_car_field(
-            0, self.Htheta.values, self.Hphi.values, theta, phi
+        h_x, h_y, h_z = self.monitor.sph_2_car_field_trig(
+            0, self.Htheta.values, self.Hphi.values, *trig
         )
         e_x, e_y, e_z, h_x, h_y, h_z = (
             np.nan_to_num(fld) for fld in [e_x, e_y, e_z, h_x, h_y, h_z]
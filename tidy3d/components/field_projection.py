@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Tuple, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 import autograd.numpy as anp
 import numpy as np
@@ -37,16 +37,92 @@ from .monitor import (
     FieldProjectionKSpaceMonitor,
     FieldProjectionSurface,
 )
-from .types import ArrayComplex4D, Coordinate, Direction
+from .types import ArrayComplex4D, Coordinate, Direction, Literal
 
 # Default number of points per wavelength in the background medium to use for resampling fields.
 PTS_PER_WVL = 10
 
+# Maximum size in bytes of the intermediate arrays in the far field surface integrals; larger
+# sets of observation angles are integrated in chunks.
+MAX_INTEGRAL_BYTES = 2**28
+
 # Numpy float array and related array types
 
 ArrayLikeN2F = Union[float, Tuple[float, ...], ArrayComplex4D]
 
 
+def _propagation_phase(
+    wavenumber: complex, dist: np.ndarray, dtype: np.dtype = complex
+) -> np.ndarray:
+    """Phase ``exp(-1j * wavenumber * dist)`` accumulated over the distances ``dist``, of the
+    complex type ``dtype``. In a lossless medium the exponent is purely imaginary, so the phase
+    is filled in directly from the cosine and sine of the real argument instead of evaluating a
+    complex exponential.
+    """
+    if np.imag(wavenumber) != 0:
+        return np.exp(-1j * wavenumber * dist).astype(dtype, copy=False)
+    arg = -np.real(wavenumber) * dist
+    phase = np.empty(arg.shape, dtype=dtype)
+    np.cos(arg, out=phase.real)
+    np.sin(arg, out=phase.imag)
+    return phase
+
+
+def _radiation_integrals(
+    phase_x: np.ndarray, phase_y: np.ndarray, phase_z: np.ndarray, sources: np.ndarray
+) -> np.ndarray:
+    """Integrals of the phase-weighted ``sources`` over all source points.
+
+    Parameters
+    ----------
+    phase_x : np.ndarray
+        Phase of shape ``(x, theta, phi)`` associated with the source x-coordinates.
+    phase_y : np.ndarray
+        Phase of shape ``(y, theta, phi)`` associated with the source y-coordinates.
+    phase_z : np.ndarray
+        Phase of shape ``(z, theta)`` associated with the source z-coordinates.
+    sources : np.ndarray
+        Integration-weighted sources of shape ``(c, x, y, z)``.
+
+    Returns
+    -------
+    np.ndarray
+        Integrals of shape ``(c, theta, phi)``.
+    """
+    num_c, num_x, num_y, _ = sources.shape
+    num_t, num_p = phase_x.shape[1:]
+
+    # split the polar angles into chunks to keep the intermediate arrays within memory limits
+    bytes_per_theta = np.dtype(sources.dtype).itemsize * num_c * num_x * max(num_y, num_p)
+    chunk_size = max(1, MAX_INTEGRAL_BYTES // bytes_per_theta)
+    if num_t > chunk_size:
+        chunks = [slice(start, start + chunk_size) for start in range(0, num_t, chunk_size)]
+        return anp.concatenate(
+            [
+                _radiation_integrals(
+                    phase_x[:, chunk], phase_y[:, chunk], phase_z[:, chunk], sources
+                )
+                for chunk in chunks
+            ],
+            axis=1,
+        )
+
+    # contract one source dimension at a time so that each step is a (batched) matrix product
+
+    # sum over z: (c, x, y, theta)
+    integrals = anp.tensordot(sources, phase_z, axes=([3], [0]))
+
+    # sum over y for each theta: (theta, c * x, y) @ (theta, y, phi) -> (theta, c * x, phi)
+    integrals = anp.reshape(anp.transpose(integrals, (3, 0, 1, 2)), (num_t, num_c * num_x, num_y))
+    integrals = anp.matmul(integrals, anp.transpose(phase_y, (1, 0, 2)))
+
+    # sum over x: (theta, c, phi)
+    integrals = anp.reshape(integrals, (num_t, num_c, num_x, num_p))
+    integrals = anp.sum(integrals * anp.transpose(phase_x, (1, 0, 2))[:, None], axis=2)
+
+    return anp.transpose(integrals, (1, 0, 2))
+
+
 class FieldProjector(Tidy3dBaseModel):
     """
     Projection of near fields to points on a given observation grid.
@@ -93,6 +169,15 @@ class FieldProjector(Tidy3dBaseModel):
         units=MICROMETER,
     )
 
+    precision: Literal["single", "double"] = pydantic.Field(
+        "double",
+        title="Precision of far field integrals",
+        description="Floating point precision of the surface integrals in projections using "
+        "the far field approximation. The integrals will be faster and use less memory under "
+        "single precision, which is usually sufficient for far field patterns, but more "
+        "accurate under double precision.",
+    )
+
     @cached_property
     def is_2d_simulation(self) -> bool:
         non_zero_dims = sum(1 for size in self.sim_data.simulation.size if size != 0)
@@ -128,6 +213,7 @@ class FieldProjector(Tidy3dBaseModel):
         normal_dirs: List[Direction],
         pts_per_wavelength: int = PTS_PER_WVL,
         origin: Coordinate = None,
+        precision: Literal["single", "double"] = "double",
     ):
         """Constructs :class:`FieldProjection` from a list of surface monitors and their directions.
 
@@ -146,6 +232,9 @@ class FieldProjector(Tidy3dBaseModel):
         origin : :class:`.Coordinate`
             Local origin used for defining observation points. If ``None``, uses the
             average of the centers of all surface monitors.
+        precision : Literal["single", "double"] = "double"
+            Floating point precision of the surface integrals in projections using the far
+            field approximation.
         """
 
         if len(near_monitors) != len(normal_dirs):
@@ -164,6 +253,7 @@ class FieldProjector(Tidy3dBaseModel):
             surfaces=surfaces,
             pts_per_wavelength=pts_per_wavelength,
             origin=origin,
+            precision=precision,
         )
 
     @cached_property
@@ -181,8 +271,12 @@ class FieldProjector(Tidy3dBaseModel):
             )
 
             # shift source coordinates relative to the local origin
-            for name, origin in zip(["x", "y", "z"], self.origin):
-                current_data[name] = current_data[name] - origin
+            current_data = current_data.assign_coords(
+                {
+                    name: current_data[name].values - origin
+                    for name, origin in zip(["x", "y", "z"], self.origin)
+                }
+            )
 
             surface_currents[surface.monitor.name] = current_data
 
@@ -313,21 +407,23 @@ class FieldProjector(Tidy3dBaseModel):
         colocation_points = [None] * 3
         colocation_points[surface.axis] = surface.monitor.center[surface.axis]
 
-        # use the highest frequency associated with the monitor to resample the surface currents
-        frequency = max(surface.monitor.freqs)
-        eps_complex = medium.eps_model(frequency)
-        index_n, _ = medium.eps_complex_to_nk(eps_complex)
-        wavelength = C_0 / frequency / index_n
+        # use the highest frequency associated with the monitor to resample the surface currents;
+        # the wavelength is a plain float and is only needed when resampling
+        if pts_per_wavelength is not None:
+            frequency = max(surface.monitor.freqs)
+            eps_complex = medium.eps_model(frequency)
+            index_n, _ = medium.eps_complex_to_nk(eps_complex)
+            wavelength = float(C_0 / frequency / index_n)
 
         _, idx_uv = surface.monitor.pop_axis((0, 1, 2), axis=surface.axis)
 
         for idx in idx_uv:
             # pick sample points on the monitor and handle the possibility of an "infinite" monitor
-            start = np.maximum(
+            start = max(
                 surface.monitor.center[idx] - surface.monitor.size[idx] / 2.0,
                 sim_data.simulation.center[idx] - sim_data.simulation.size[idx] / 2.0,
             )
-            stop = np.minimum(
+            stop = min(
                 surface.monitor.center[idx] + surface.monitor.size[idx] / 2.0,
                 sim_data.simulation.center[idx] + sim_data.simulation.size[idx] / 2.0,
             )
@@ -383,17 +479,75 @@ class FieldProjector(Tidy3dBaseModel):
                 ary = ary[(slice(None),) * (axis - idx) + (0,)]
         return ary
 
-    def _far_fields_for_surface(
+    @staticmethod
+    def trapezoid_weights(pts: np.ndarray) -> np.ndarray:
+        """Weights which, when contracted with an array sampled at ``pts``, reproduce
+        :meth:`.FieldProjector.trapezoid` along that dimension.
+
+        Parameters
+        ----------
+        pts : np.ndarray
+            Points along the integration dimension.
+
+        Returns
+        -------
+        np.ndarray
+            Integration weights for each sample.
+        """
+        pts = np.atleast_1d(pts)
+        if len(pts) == 1:  # array has only one element along axis
+            return np.ones(1)
+        dpts = np.diff(pts)
+        weights = np.zeros(len(pts))
+        weights[:-1] += dpts / 2
+        weights[1:] += dpts / 2
+        return weights
+
+    def _surface_groups(
+        self, currents: Dict[str, xr.Dataset]
+    ) -> List[Tuple[List[FieldProjectionSurface], List[xr.Dataset]]]:
+        """Group the surfaces whose currents can be integrated together. Surfaces in a group are
+        normal to the same axis and share their tangential and frequency sample points, such as
+        opposite faces of a box, so their currents only differ in the normal coordinate.
+
+        Parameters
+        ----------
+        currents : Dict[str, xarray.Dataset]
+            Surface currents associated with each surface monitor name.
+
+        Returns
+        -------
+        List[Tuple[List[:class:`FieldProjectionSurface`], List[xarray.Dataset]]]
+            Surfaces of each group and their associated currents.
+        """
+        groups = []
+        for surface in self.surfaces:
+            surface_currents = currents[surface.monitor.name]
+            _, tangential_dims = surface.monitor.pop_axis(("x", "y", "z"), axis=surface.axis)
+            for surfaces, group_currents in groups:
+                if surfaces[0].axis == surface.axis and all(
+                    np.array_equal(group_currents[0][dim].values, surface_currents[dim].values)
+                    for dim in (*tangential_dims, "f")
+                ):
+                    surfaces.append(surface)
+                    group_currents.append(surface_currents)
+                    break
+            else:
+                groups.append(([surface], [surface_currents]))
+        return groups
+
+    def _far_fields_for_surfaces(
         self,
         frequency: float,
         theta: ArrayLikeN2F,
         phi: ArrayLikeN2F,
-        surface: FieldProjectionSurface,
-        currents: xr.Dataset,
+        surfaces: List[FieldProjectionSurface],
+        currents: List[xr.Dataset],
         medium: MediumType,
     ) -> np.ndarray:
         """Compute far fields at an angle in spherical coordinates
-        for a given set of surface currents and observation angles.
+        for a given set of surface currents and observation angles, summed over a group of
+        surfaces as returned by :meth:`.FieldProjector._surface_groups`.
 
         Parameters
         ----------
@@ -403,11 +557,14 @@ class FieldProjector(Tidy3dBaseModel):
         theta : Union[float, Tuple[float, ...], np.ndarray]
             Polar angles (rad) downward from x=y=0 line relative to the local origin.
         phi : Union[float, Tuple[float, ...], np.ndarray]
-            Azimuthal (rad) angles from y=z=0 line relative to the local origin.
-        surface: :class:`FieldProjectionSurface`
-            :class:`FieldProjectionSurface` object to use as source of near field.
-        currents : xarray.Dataset
-            xarray Dataset containing surface currents associated with the surface monitor.
+            Azimuthal (rad) angles from y=z=0 line relative to the local origin. A 1D array
+            defines a grid of observation angles together with ``theta``, while a 2D array
+            of shape ``(len(theta), N)`` holds ``N`` azimuthal angles for each polar angle.
+        surfaces: List[:class:`FieldProjectionSurface`]
+            :class:`FieldProjectionSurface` objects normal to the same axis to use as source
+            of near field.
+        currents : List[xarray.Dataset]
+            xarray Datasets containing surface currents associated with each surface monitor.
         medium : :class:`.MediumType`
             Background medium through which to project fields.
 
@@ -417,12 +574,16 @@ class FieldProjector(Tidy3dBaseModel):
             With leading dimension containing ``Er``, ``Etheta``, ``Ephi``, ``Hr``, ``Htheta``, ``Hphi``
             projected fields for each frequency.
         """
-        try:
-            currents_f = currents.sel(f=frequency)
-        except Exception as e:
+        surface = surfaces[0]
+
+        # the surfaces of a group share their frequency samples, so the frequency is looked up
+        # once and the currents of each surface are selected by position
+        idx_f = np.flatnonzero(currents[0]["f"].values == frequency)
+        if idx_f.size == 0:
             raise SetupError(
                 f"Frequency {frequency} not found in fields for monitor '{surface.monitor.name}'."
-            ) from e
+            )
+        currents_f = [surface_currents.isel(f=idx_f[0]) for surface_currents in currents]
 
         idx_w, idx_uv = surface.monitor.pop_axis((0, 1, 2), axis=surface.axis)
         _, source_names = surface.monitor.pop_axis(("x", "y", "z"), axis=surface.axis)
@@ -443,65 +604,83 @@ class FieldProjector(Tidy3dBaseModel):
 
         theta = np.atleast_1d(theta)
         phi = np.atleast_1d(phi)
+        if phi.ndim == 1:
+            phi = phi[None, :]
 
-        propagation_factor = -1j * AbstractFieldProjectionData.wavenumber(
-            medium=medium, frequency=frequency
-        )
+        wavenumber = AbstractFieldProjectionData.wavenumber(medium=medium, frequency=frequency)
 
-        sin_theta = np.sin(theta)
-        cos_theta = np.cos(theta)
+        sin_theta = np.sin(theta)[:, None]
+        cos_theta = np.cos(theta)[:, None]
         sin_phi = np.sin(phi)
         cos_phi = np.cos(phi)
 
-        pts = [currents[name].values for name in ["x", "y", "z"]]
+        # the surfaces are stacked along their normal axis
+        pts = [currents[0][name].values for name in ["x", "y", "z"]]
+        pts[surface.axis] = np.concatenate(
+            [
+                surface_currents[("x", "y", "z")[surface.axis]].values
+                for surface_currents in currents
+            ]
+        )
 
-        phase_0 = np.exp(np.einsum("i,j,k->ijk", propagation_factor * pts[0], sin_theta, cos_phi))
-        phase_1 = np.exp(np.einsum("i,j,k->ijk", propagation_factor * pts[1], sin_theta, sin_phi))
-        phase_2 = np.exp(np.einsum("i,j->ij", propagation_factor * pts[2], cos_theta))
+        dtype = np.complex64 if self.precision == "single" else np.complex128
+        phase_0 = _propagation_phase(
+            wavenumber, np.multiply.outer(pts[0], sin_theta * cos_phi), dtype
+        )
+        phase_1 = _propagation_phase(
+            wavenumber, np.multiply.outer(pts[1], sin_theta * sin_phi), dtype
+        )
+        phase_2 = _propagation_phase(wavenumber, np.multiply.outer(pts[2], cos_theta[:, 0]), dtype)
 
         E1 = "E" + cmp_1
         E2 = "E" + cmp_2
         H1 = "H" + cmp_1
         H2 = "H" + cmp_2
 
-        def contract(currents):
-            return anp.einsum("xtp,ytp,zt,xyz->xyztp", phase_0, phase_1, phase_2, currents)
-
-        jm = []
-        for field_component in (E1, E2, H1, H2):
-            currents = currents_f[field_component].data
-            currents = anp.reshape(currents, currents_f[field_component].shape)
-            currents_phase = contract(currents)
-
-            if self.is_2d_simulation:
-                jm_i = self.trapezoid(currents_phase, pts[idx_int_1d], idx_int_1d)
-            else:
-                jm_i = self.trapezoid(currents_phase, (pts[idx_u], pts[idx_v]), (idx_u, idx_v))
-
-            jm.append(anp.reshape(jm_i, (len(theta), len(phi))))
-
-        order = [idx_u, idx_v, idx_w]
-        zeros = np.zeros(jm[0].shape)
-
-        # for each index (0, 1, 2), if it’s in the first two elements of order,
-        # select the corresponding jm element for J or the offset element (+2) for M
-        J = anp.array([jm[order.index(i)] if i in order[:2] else zeros for i in range(3)])
-        M = anp.array([jm[order.index(i) + 2] if i in order[:2] else zeros for i in range(3)])
-
-        cos_theta_cos_phi = cos_theta[:, None] * cos_phi[None, :]
-        cos_theta_sin_phi = cos_theta[:, None] * sin_phi[None, :]
-
-        # Ntheta (8.33a)
-        Ntheta = J[0] * cos_theta_cos_phi + J[1] * cos_theta_sin_phi - J[2] * sin_theta[:, None]
-
-        # Nphi (8.33b)
-        Nphi = -J[0] * sin_phi[None, :] + J[1] * cos_phi[None, :]
-
-        # Ltheta  (8.34a)
-        Ltheta = M[0] * cos_theta_cos_phi + M[1] * cos_theta_sin_phi - M[2] * sin_theta[:, None]
+        # trapezoidal weights along the integration dimensions; each surface contributes its
+        # own sample along the normal dimension, and any other dimension is singular and its
+        # only sample is used as is
+        int_axes = (idx_int_1d,) if self.is_2d_simulation else (idx_u, idx_v)
+        weights = [np.eye(1, len(pt))[0] for pt in pts]
+        weights[idx_w] = np.ones(len(pts[idx_w]))
+        for axis in int_axes:
+            weights[axis] = self.trapezoid_weights(pts[axis])
+        weights = np.einsum("x,y,z->xyz", *weights)
+
+        # integrate all four tangential current components of all surfaces in a single
+        # contraction
+        currents = anp.stack(
+            [
+                anp.concatenate(
+                    [
+                        anp.reshape(surface_currents[name].data, surface_currents[name].shape)
+                        for surface_currents in currents_f
+                    ],
+                    axis=idx_w,
+                )
+                for name in (E1, E2, H1, H2)
+            ]
+        )
+        jm = _radiation_integrals(
+            phase_0, phase_1, phase_2, (currents * weights).astype(dtype, copy=False)
+        )
 
-        # Lphi  (8.34b)
-        Lphi = -M[0] * sin_phi[None, :] + M[1] * cos_phi[None, :]
+        # theta and phi unit vectors, of which only the tangential components are needed since
+        # the currents have no normal component
+        shape = jm.shape[1:]
+        unit_vectors = np.zeros((2, 3, *shape))
+        unit_vectors[0, 0] = cos_theta * cos_phi
+        unit_vectors[0, 1] = cos_theta * sin_phi
+        unit_vectors[0, 2] = -sin_theta
+        unit_vectors[1, 0] = -sin_phi
+        unit_vectors[1, 1] = cos_phi
+        unit_vectors = unit_vectors[:, [idx_u, idx_v]]
+
+        # project J and M onto the unit vectors in a single contraction, giving
+        # Ntheta, Nphi (8.33a, 8.33b) and Ltheta, Lphi (8.34a, 8.34b)
+        jm = anp.reshape(jm, (2, 2, *shape))
+        nl = anp.einsum("sctp,jctp->jstp", unit_vectors, jm)
+        Ntheta, Nphi, Ltheta, Lphi = nl[0, 0], nl[0, 1], nl[1, 0], nl[1, 1]
 
         eta = ETA_0 / np.sqrt(medium.eps_model(frequency))
 
@@ -553,6 +732,17 @@ class FieldProjector(Tidy3dBaseModel):
 
         return new_currents
 
+    def _windowed_currents(
+        self, proj_monitor: AbstractFieldProjectionMonitor
+    ) -> Dict[str, xr.Dataset]:
+        """Surface currents of each surface with the projection monitor's window applied.
+        These do not depend on the observation points, so they are computed once per projection.
+        """
+        return {
+            name: self.apply_window_to_currents(proj_monitor, currents)
+            for name, currents in self.currents.items()
+        }
+
     def project_fields(
         self, proj_monitor: AbstractFieldProjectionMonitor
     ) -> AbstractFieldProjectionData:
@@ -607,22 +797,23 @@ class FieldProjector(Tidy3dBaseModel):
             )
         )
 
-        for surface in self.surfaces:
-            # apply windowing to currents
-            currents = self.apply_window_to_currents(monitor, self.currents[surface.monitor.name])
+        windowed_currents = self._windowed_currents(monitor)
 
-            if monitor.far_field_approx:
+        if monitor.far_field_approx:
+            for surfaces, currents in self._surface_groups(windowed_currents):
                 for idx_f, frequency in enumerate(freqs):
-                    _fields = self._far_fields_for_surface(
+                    _fields = self._far_fields_for_surfaces(
                         frequency=frequency,
                         theta=theta,
                         phi=phi,
-                        surface=surface,
+                        surfaces=surfaces,
                         currents=currents,
                         medium=medium,
                     )
                     fields = add_at(fields, [..., idx_f], _fields[:, None] * phase[idx_f])
-            else:
+        else:
+            for surface in self.surfaces:
+                currents = windowed_currents[surface.monitor.name]
                 iter_coords = [
                     ([_theta, _phi], [i, j])
                     for i, _theta in enumerate(theta)
@@ -683,46 +874,50 @@ class FieldProjector(Tidy3dBaseModel):
         medium = monitor.medium if monitor.medium else self.medium
         wavenumber = AbstractFieldProjectionData.wavenumber(medium=medium, frequency=freqs)
 
-        # Zip together all combinations of observation points for better progress tracking
-        iter_coords = [
-            ([_x, _y, _z], [i, j, k])
-            for i, _x in enumerate(x)
-            for j, _y in enumerate(y)
-            for k, _z in enumerate(z)
-        ]
+        windowed_currents = self._windowed_currents(monitor)
 
-        for (_x, _y, _z), (i, j, k) in track(
-            iter_coords, description="Computing projected fields", console=get_logging_console()
-        ):
-            r, theta, phi = monitor.car_2_sph(_x, _y, _z)
-            phase = np.atleast_1d(
-                AbstractFieldProjectionData.propagation_factor(
-                    dist=r, k=wavenumber, is_2d_simulation=self.is_2d_simulation
-                )
+        if monitor.far_field_approx:
+            # project onto all observation points at once, each given by a (theta, phi) pair
+            r, theta, phi = np.broadcast_arrays(
+                *monitor.car_2_sph(x[:, None, None], y[None, :, None], z[None, None, :])
+            )
+            phase = AbstractFieldProjectionData.propagation_factor(
+                dist=r[..., None], k=wavenumber, is_2d_simulation=self.is_2d_simulation
             )
 
-            for surface in self.surfaces:
-                # apply windowing to currents
-                currents = self.apply_window_to_currents(
-                    monitor, self.currents[surface.monitor.name]
-                )
+            for surfaces, currents in self._surface_groups(windowed_currents):
+                for idx_f, frequency in enumerate(freqs):
+                    _fields = self._far_fields_for_surfaces(
+                        frequency=frequency,
+                        theta=theta.ravel(),
+                        phi=phi.ravel()[:, None],
+                        surfaces=surfaces,
+                        currents=currents,
+                        medium=medium,
+                    )
+                    _fields = anp.reshape(_fields, fields.shape[:-1])
+                    fields = add_at(fields, [..., idx_f], _fields * phase[..., idx_f])
+
+        else:
+            # Zip together all combinations of observation points for better progress tracking
+            iter_coords = [
+                ([_x, _y, _z], [i, j, k])
+                for i, _x in enumerate(x)
+                for j, _y in enumerate(y)
+                for k, _z in enumerate(z)
+            ]
 
-                if monitor.far_field_approx:
-                    for idx_f, frequency in enumerate(freqs):
-                        _fields = self._far_fields_for_surface(
-                            frequency=frequency,
-                            theta=theta,
-                            phi=phi,
-                            surface=surface,
-                            currents=currents,
-                            medium=medium,
-                        )
-                        where = (slice(None), i, j, k, idx_f)
-                        _fields = anp.reshape(_fields, fields[where].shape)
-                        fields = add_at(fields, where, _fields * phase[idx_f])
-                else:
+            for (_x, _y, _z), (i, j, k) in track(
+                iter_coords, description="Computing projected fields", console=get_logging_console()
+            ):
+                for surface in self.surfaces:
                     _fields = self._fields_for_surface_exact(
-                        x=_x, y=_y, z=_z, surface=surface, currents=currents, medium=medium
+                        x=_x,
+                        y=_y,
+                        z=_z,
+                        surface=surface,
+                        currents=windowed_currents[surface.monitor.name],
+                        medium=medium,
                     )
                     where = (slice(None), i, j, k)
                     _fields = anp.reshape(_fields, fields[where].shape)
@@ -769,37 +964,47 @@ class FieldProjector(Tidy3dBaseModel):
             )
         )
 
-        # Zip together all combinations of observation points for better progress tracking
-        iter_coords = [([_ux, _uy], [i, j]) for i, _ux in enumerate(ux) for j, _uy in enumerate(uy)]
+        windowed_currents = self._windowed_currents(monitor)
 
-        for (_ux, _uy), (i, j) in track(
-            iter_coords, description="Computing projected fields", console=get_logging_console()
-        ):
-            theta, phi = monitor.kspace_2_sph(_ux, _uy, monitor.proj_axis)
+        if monitor.far_field_approx:
+            # project onto all observation points at once, each given by a (theta, phi) pair
+            theta, phi = np.broadcast_arrays(
+                *monitor.kspace_2_sph(ux[:, None], uy[None, :], monitor.proj_axis)
+            )
 
-            for surface in self.surfaces:
-                # apply windowing to currents
-                currents = self.apply_window_to_currents(
-                    monitor, self.currents[surface.monitor.name]
-                )
+            for surfaces, currents in self._surface_groups(windowed_currents):
+                for idx_f, frequency in enumerate(freqs):
+                    _fields = self._far_fields_for_surfaces(
+                        frequency=frequency,
+                        theta=theta.ravel(),
+                        phi=phi.ravel()[:, None],
+                        surfaces=surfaces,
+                        currents=currents,
+                        medium=medium,
+                    )
+                    _fields = anp.reshape(_fields, fields.shape[:-1])
+                    fields = add_at(fields, [..., idx_f], _fields * phase[idx_f])
+
+        else:
+            # Zip together all combinations of observation points for better progress tracking
+            iter_coords = [
+                ([_ux, _uy], [i, j]) for i, _ux in enumerate(ux) for j, _uy in enumerate(uy)
+            ]
+
+            for (_ux, _uy), (i, j) in track(
+                iter_coords, description="Computing projected fields", console=get_logging_console()
+            ):
+                theta, phi = monitor.kspace_2_sph(_ux, _uy, monitor.proj_axis)
+                _x, _y, _z = monitor.sph_2_car(monitor.proj_distance, theta, phi)
 
-                if monitor.far_field_approx:
-                    for idx_f, frequency in enumerate(freqs):
-                        _fields = self._far_fields_for_surface(
-                            frequency=frequency,
-                            theta=theta,
-                            phi=phi,
-                            surface=surface,
-                            currents=currents,
-                            medium=medium,
-                        )
-                        where = (slice(None), i, j, 0, idx_f)
-                        _fields = anp.reshape(_fields, fields[where].shape)
-                        fields = add_at(fields, where, _fields * phase[idx_f])
-                else:
-                    _x, _y, _z = monitor.sph_2_car(monitor.proj_distance, theta, phi)
+                for surface in self.surfaces:
                     _fields = self._fields_for_surface_exact(
-                        x=_x, y=_y, z=_z, surface=surface, currents=currents, medium=medium
+                        x=_x,
+                        y=_y,
+                        z=_z,
+                        surface=surface,
+                        currents=windowed_currents[surface.monitor.name],
+                        medium=medium,
                     )
                     where = (slice(None), i, j, 0)
                     _fields = anp.reshape(_fields, fields[where].shape)
@@ -943,7 +1148,9 @@ class FieldProjector(Tidy3dBaseModel):
                 dG_dr * r_dot_current_dphi_div_sin_theta(current) / r,
             ]
             # convert to Cartesian coordinates
-            return surface.monitor.sph_2_car_field(temp[0], temp[1], temp[2], theta_obs, phi_obs)
+            return surface.monitor.sph_2_car_field_trig(
+                temp[0], temp[1], temp[2], sin_theta, cos_theta, sin_phi, cos_phi
+            )
 
         def potential_terms(current: Tuple[np.ndarray, ...], const: complex):
             """Assemble vector potential and its derivatives."""
@@ -916,10 +916,46 @@ class Geometry(Tidy3dBaseModel, ABC):
         Tuple[float, float, float]
             x, y, and z components of the vector field in cartesian coordinates.
         """
-        sin_theta = np.sin(theta)
-        cos_theta = np.cos(theta)
-        sin_phi = np.sin(phi)
-        cos_phi = np.cos(phi)
+        return Geometry.sph_2_car_field_trig(
+            f_r, f_theta, f_phi, np.sin(theta), np.cos(theta), np.sin(phi), np.cos(phi)
+        )
+
+    @staticmethod
+    def sph_2_car_field_trig(
+        f_r: float,
+        f_theta: float,
+        f_phi: float,
+        sin_theta: float,
+        cos_theta: float,
+        sin_phi: float,
+        cos_phi: float,
+    ) -> Tuple[complex, complex, complex]:
+        """Convert vector field components in spherical coordinates to cartesian, given the
+        sines and cosines of the angles of the location of the vector field. Useful when the
+        same angles are used for several conversions.
+
+        Parameters
+        ----------
+        f_r : float
+            radial component of the vector field.
+        f_theta : float
+            polar angle component of the vector field.
+        f_phi : float
+            azimuthal angle component of the vector field.
+        sin_theta : float
+            sine of the polar angle of location of the vector field.
+        cos_theta : float
+            cosine of the polar angle of location of the vector field.
+        sin_phi : float
+            sine of the azimuthal angle of location of the vector field.
+        cos_phi : float
+            cosine of the azimuthal angle of location of the vector field.
+
+        Returns
+        -------
+        Tuple[float, float, float]
+            x, y, and z components of the vector field in cartesian coordinates.
+        """
         f_x = f_r * sin_theta * cos_phi + f_theta * cos_theta * cos_phi - f_phi * sin_phi
         f_y = f_r * sin_theta * sin_phi + f_theta * cos_theta * sin_phi + f_phi * cos_phi
         f_z = f_r * cos_theta - f_theta * sin_theta
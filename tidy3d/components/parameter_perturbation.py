@@ -6,7 +6,6 @@ import functools
 from abc import ABC, abstractmethod
 from typing import Callable, List, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pydantic.v1 as pd
 
@@ -577,6 +576,8 @@ class ChargePerturbation(AbstractPerturbation):
             ax.legend()
 
         else:
+            import matplotlib.pyplot as plt
+
             e_mesh, h_mesh = np.meshgrid(electron_density, hole_density, indexing="ij")
             pc = ax.pcolormesh(e_mesh, h_mesh, values, shading="gouraud")
             plt.colorbar(pc, ax=ax)
@@ -6,7 +6,6 @@ from typing import Dict, List, Set, Tuple, Union
 
 import autograd.numpy as np
 import matplotlib as mpl
-import matplotlib.pylab as plt
 import pydantic.v1 as pd
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
@@ -454,6 +453,8 @@ class Scene(Tidy3dBaseModel):
     @staticmethod
     def _add_cbar(vmin: float, vmax: float, label: str, cmap: str, ax: Ax = None) -> None:
         """Add a colorbar to plot."""
+        import matplotlib.pyplot as plt
+
         norm = mpl.colors.Normalize(vmin=vmin, vmax=vmax)
         divider = make_axes_locatable(ax)
         cax = divider.append_axes("right", size="5%", pad=0.15)
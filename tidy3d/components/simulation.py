@@ -2840,21 +2840,17 @@ class Simulation(AbstractYeeGridSimulation):
 
                     projecting_backwards = False
                     if isinstance(monitor, FieldProjectionAngleMonitor):
-                        r, theta, phi = np.meshgrid(
-                            monitor.proj_distance,
-                            monitor.theta,
-                            monitor.phi,
-                            indexing="ij",
+                        x, y, z = Geometry.sph_2_car(
+                            r=monitor.proj_distance,
+                            theta=np.array(monitor.theta)[:, None],
+                            phi=np.array(monitor.phi)[None, :],
                         )
-                        x, y, z = Geometry.sph_2_car(r=r, theta=theta, phi=phi)
                     elif isinstance(monitor, FieldProjectionKSpaceMonitor):
-                        uxs, uys, _ = np.meshgrid(
-                            monitor.ux,
-                            monitor.uy,
-                            monitor.proj_distance,
-                            indexing="ij",
+                        theta, phi = monitor.kspace_2_sph(
+                            np.array(monitor.ux)[:, None],
+                            np.array(monitor.uy)[None, :],
+                            monitor.proj_axis,
                         )
-                        theta, phi = monitor.kspace_2_sph(uxs, uys, monitor.proj_axis)
                         x, y, z = Geometry.sph_2_car(r=monitor.proj_distance, theta=theta, phi=phi)
                     else:
                         pts = monitor.unpop_axis(
@@ -6,7 +6,6 @@ from functools import wraps
 from html import escape
 from typing import Any
 
-import matplotlib.pyplot as plt
 import pydantic.v1 as pd
 from matplotlib.patches import ArrowStyle, PathPatch
 from matplotlib.path import Path
@@ -34,6 +33,8 @@ ARROW_LENGTH = 0.3
 
 def make_ax() -> Ax:
     """makes an empty ``ax``."""
+    import matplotlib.pyplot as plt
+
     _, ax = plt.subplots(1, 1, tight_layout=True)
     return ax
 
@@ -46,9 +47,9 @@ def add_ax_if_none(plot):
     @wraps(plot)
     def _plot(*args, **kwargs) -> Ax:
         """New plot function using a generated ax if None."""
+        # only create a figure when no axes are supplied
         if kwargs.get("ax") is None:
-            ax = make_ax()
-            kwargs["ax"] = ax
+            kwargs["ax"] = make_ax()
         return plot(*args, **kwargs)
 
     return _plot
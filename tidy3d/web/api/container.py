@@ -19,6 +19,7 @@ from ...exceptions import DataError
 from ...log import get_logging_console, log
 from ..api import webapi as web
 from ..core.constants import TaskId, TaskName
+from ..core.task_core import Folder
 from ..core.task_info import RunInfo, TaskInfo
 from .tidy3d_stub import SimulationDataType, SimulationType
 
@@ -621,6 +622,12 @@ class Batch(WebContainer):
     def upload(self) -> None:
         """Upload a series of tasks associated with this ``Batch`` using multi-threading."""
 
+        # resolve the shared folder once up front, so the concurrent task creations below reuse
+        # the cached folder instead of each looking it up (and possibly creating it) separately;
+        # jobs that already have a task ID are not uploaded and do not need it
+        if any(job.task_id_cached is None for job in self.jobs.values()):
+            Folder.get(self.folder_name, create=True)
+
         with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
             futures = [executor.submit(job.upload) for _, job in self.jobs.items()]
 
@@ -642,11 +649,9 @@ class Batch(WebContainer):
         Dict[str, :class:`TaskInfo`]
             Mapping of task name to data about task associated with each task.
         """
-        info_dict = {}
-        for task_name, job in self.jobs.items():
-            task_info = job.get_info()
-            info_dict[task_name] = task_info
-        return info_dict
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            task_infos = executor.map(lambda job: job.get_info(), self.jobs.values())
+            return dict(zip(self.jobs.keys(), task_infos))
 
     def start(self) -> None:
         """Start running all tasks in the :class:`Batch`.
@@ -815,32 +820,25 @@ class Batch(WebContainer):
 
         self.to_file(self._batch_path(path_dir=path_dir))
 
-        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-            fns = []
-            for task_name, job in self.jobs.items():
-                job_path = self._job_data_path(task_id=job.task_id, path_dir=path_dir)
-
-                if "error" in job.status:
-                    log.warning(f"Not downloading '{task_name}' as the task errored.")
-                    continue
-
-                def fn(job=job, job_path=job_path) -> None:
-                    """Function to submit by executor, local variables bound by making kwargs."""
-                    return job.download(path=job_path)
-
-                fns.append(fn)
+        def fn(task_name: TaskName, job: Job) -> None:
+            """Function to submit by executor, checks the task status and downloads its data."""
+            if "error" in job.status:
+                log.warning(f"Not downloading '{task_name}' as the task errored.")
+                return
+            job.download(path=self._job_data_path(task_id=job.task_id, path_dir=path_dir))
 
-            futures = [executor.submit(fn) for fn in fns]
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = [executor.submit(fn, task_name, job) for task_name, job in self.jobs.items()]
 
-            # progressbar (number of eligible tasks downloaded)
+            # progressbar (number of tasks processed)
             if self.verbose:
                 console = get_logging_console()
                 with Progress(console=console) as progress:
-                    pbar_message = f"Downloading data for {len(fns)} tasks."
-                    pbar = progress.add_task(pbar_message, total=len(fns) - 1)
+                    pbar_message = f"Downloading data for {self.num_jobs} tasks."
+                    pbar = progress.add_task(pbar_message, total=self.num_jobs - 1)
                     for _ in concurrent.futures.as_completed(futures):
                         progress.update(pbar, advance=1)
-                    progress.update(pbar, completed=len(fns) - 1, refresh=True)
+                    progress.update(pbar, completed=self.num_jobs - 1, refresh=True)
 
     def load(self, path_dir: str = DEFAULT_DATA_DIR) -> BatchData:
         """Download results and load them into :class:`.BatchData` object.
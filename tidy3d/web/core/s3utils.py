@@ -173,10 +173,12 @@ def _get_progress(action: _S3Action):
     )
 
 
+# transfer large files in 8 MB parts; much smaller parts turn a multi-GB simulation data
+# download into tens of thousands of tiny ranged requests, bounded by request latency
 _s3_config = TransferConfig(
-    multipart_threshold=1024 * 25,
-    max_concurrency=50,
-    multipart_chunksize=1024 * 25,
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=10,
+    multipart_chunksize=8 * 1024 * 1024,
     use_threads=True,
 )
 